@@ -0,0 +1,41 @@
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.core.mail import send_mail
+
+logger = logging.getLogger(__name__)
+
+_executor = ThreadPoolExecutor(max_workers=2)
+
+
+def _send_confirmation_email(email, confirmation_code):
+    send_mail(
+        'E-mail verification',
+        f'Your confirmation_code is {confirmation_code}',
+        'register@yamdb.ru',
+        [email],
+    )
+
+
+def _log_send_failure(future):
+    error = future.exception()
+    if error is not None:
+        logger.error(
+            'Failed to send confirmation email', exc_info=error
+        )
+
+
+def send_confirmation_email(email, confirmation_code):
+    """
+    Sends email with confirmation code to the user.
+    When EMAIL_ASYNC setting is on, email is sent in a background thread
+    so SMTP round-trip is not spent inside the request.
+    """
+    if settings.EMAIL_ASYNC:
+        future = _executor.submit(
+            _send_confirmation_email, email, confirmation_code
+        )
+        future.add_done_callback(_log_send_failure)
+    else:
+        _send_confirmation_email(email, confirmation_code)
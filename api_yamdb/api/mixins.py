@@ -1,3 +1,4 @@
+from django.shortcuts import get_object_or_404
 from rest_framework import mixins, viewsets
 
 
@@ -12,3 +13,37 @@ class ListCreateDestroyViewSet(
     """
 
     pass
+
+
+class ParentObjectMixin:
+    """
+    Gives access to the object from the URL that listed objects belong
+    to (title of reviews, review of comments) and attaches created
+    objects to it.
+    The parent is looked up by pk only, once per request. It is checked
+    before the insert: foreign keys are deferred to the commit, so a
+    missing parent would otherwise be noticed only after the response.
+    """
+
+    parent_model = None
+    parent_url_kwarg = None
+    parent_field = None
+
+    def get_parent(self):
+        if not hasattr(self, '_parent'):
+            self._parent = get_object_or_404(
+                self.parent_model.objects.only('id'),
+                pk=self.kwargs.get(self.parent_url_kwarg),
+            )
+        return self._parent
+
+    def create(self, request, *args, **kwargs):
+        # missing parent gives 404 before validation errors
+        self.get_parent()
+        return super().create(request, *args, **kwargs)
+
+    def perform_create(self, serializer):
+        serializer.save(
+            **{self.parent_field: self.get_parent()},
+            author=self.request.user,
+        )
@@ -0,0 +1,39 @@
+from django.conf import settings
+from rest_framework.pagination import CursorPagination, PageNumberPagination
+
+
+class PubDateCursorPagination(CursorPagination):
+    """
+    Keyset pagination by publication date, in the models' default
+    order, so enabling it does not reorder entries for clients.
+    Unlike page number pagination it does not need COUNT(*) and
+    OFFSET queries, so the cost of a page does not depend on how
+    deep it is. The response has no `count` field though.
+    """
+
+    ordering = 'pub_date'
+
+
+def get_pub_date_pagination_class():
+    """
+    Returns the paginator for reviews and comments lists.
+    Cursor pagination is enabled with REVIEWS_CURSOR_PAGINATION setting,
+    page number pagination is kept by default for clients relying on
+    `count` field.
+    """
+    if settings.REVIEWS_CURSOR_PAGINATION:
+        return PubDateCursorPagination
+    return PageNumberPagination
+
+
+class PubDatePaginationMixin:
+    """
+    Picks the paginator for every request instead of at import time,
+    so changes of REVIEWS_CURSOR_PAGINATION setting take effect.
+    """
+
+    @property
+    def paginator(self):
+        if not hasattr(self, '_paginator'):
+            self._paginator = get_pub_date_pagination_class()()
+        return self._paginator
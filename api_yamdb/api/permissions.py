@@ -1,6 +1,30 @@
 from rest_framework import permissions
 
-from users.models import ROLES
+from users.models import ADMIN_ROLE, MOD_ROLE
+
+
+def get_role(request):
+    '''
+    Return role of the request user, reading it only once per request.
+    '''
+    role = getattr(request, '_yamdb_role', None)
+    if role is None:
+        role = request._yamdb_role = request.user.role
+    return role
+
+
+def is_moderator_or_admin(request):
+    '''
+    Check whether request user is moderator, admin or superuser,
+    evaluating it only once per request.
+    '''
+    result = getattr(request, '_yamdb_is_mod_or_admin', None)
+    if result is None:
+        result = request._yamdb_is_mod_or_admin = (
+            request.user.is_superuser
+            or get_role(request) in (MOD_ROLE, ADMIN_ROLE)
+        )
+    return result
 
 
 class IsReadOnly(permissions.BasePermission):
@@ -24,12 +48,12 @@ class IsAdmin(permissions.BasePermission):
         # only to the admin user
         if request.user.is_anonymous:
             return False
-        return request.user.role == ROLES.admin.name
+        return get_role(request) == ADMIN_ROLE
 
     def has_object_permission(self, request, view, obj):
         if request.user.is_anonymous:
             return False
-        return request.user.role == ROLES.admin.name
+        return get_role(request) == ADMIN_ROLE
 
 
 class IsSuperuser(permissions.BasePermission):
@@ -46,28 +70,26 @@ class IsSuperuser(permissions.BasePermission):
         return request.user.is_superuser
 
 
-class IsModerator(permissions.BasePermission):
+class IsAuthor(permissions.BasePermission):
     '''
-    Global permission to only allow admin users to edit it.
+    Check permissions for read-only and write request.
     '''
 
-    def has_permission(self, request, view):
-        # Read permissions are allowed to any request but other
-        # only to the admin user
-        if request.user.is_anonymous:
-            return False
-        return request.user.role == ROLES.moderator.name
-
     def has_object_permission(self, request, view, obj):
-        if request.user.is_anonymous:
-            return False
-        return request.user.role == ROLES.moderator.name
+        return obj.author == request.user
 
 
-class IsAuthor(permissions.BasePermission):
+class IsAuthorOrStaff(permissions.BasePermission):
     '''
-    Check permissions for read-only and write request.
+    Allow authenticated users to edit their own objects and moderators,
+    admins and superusers to edit any object.
     '''
 
+    def has_permission(self, request, view):
+        return request.user.is_authenticated
+
     def has_object_permission(self, request, view, obj):
-        return obj.author == request.user
+        return (
+            is_moderator_or_admin(request)
+            or obj.author_id == request.user.pk
+        )
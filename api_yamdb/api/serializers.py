@@ -1,23 +1,54 @@
+from django.db import IntegrityError, transaction
+from django.db.models import F
 from django.shortcuts import get_object_or_404
 from rest_framework import serializers
-from rest_framework.validators import UniqueTogetherValidator, UniqueValidator
+from rest_framework.settings import api_settings
 
 from reviews.models import Category, Comment, Genre, GenreTitle, Review, Title
 from reviews.validators import validate_not_future_year
-from users.models import User
+from users.models import CONFIRMATION_CODE_MAX_ATTEMPTS, User
 
 
-class CategorySerializer(serializers.ModelSerializer):
+def is_unique_violation(error):
+    '''
+    Check whether IntegrityError is caused by unique constraint and not
+    by foreign key, not null or other constraint.
+    '''
+    pgcode = getattr(error.__cause__, 'pgcode', None)
+    if pgcode is not None:
+        return pgcode == '23505'
+    message = str(error).lower()
+    return 'unique' in message or 'duplicate' in message
 
-    slug = serializers.SlugField(
-        max_length=50,
-        validators=[
-            UniqueValidator(
-                queryset=Category.objects.all(),
-                message='Указанная категория уже есть в БД',
-            )
-        ],
-    )
+
+class UniqueConstraintMixin:
+    '''
+    Relies on database unique constraints instead of querying for
+    duplicates on every validation: a unique violation raised on save
+    is turned into a validation error with the given message.
+    '''
+
+    unique_error_message = None
+    unique_error_field = api_settings.NON_FIELD_ERRORS_KEY
+
+    def get_unique_error(self, error):
+        return {self.unique_error_field: [self.unique_error_message]}
+
+    def save(self, **kwargs):
+        try:
+            with transaction.atomic():
+                return super().save(**kwargs)
+        except IntegrityError as error:
+            if not is_unique_violation(error):
+                raise
+            raise serializers.ValidationError(self.get_unique_error(error))
+
+
+class CategorySerializer(UniqueConstraintMixin, serializers.ModelSerializer):
+
+    slug = serializers.SlugField(max_length=50, validators=[])
+    unique_error_message = 'Указанная категория уже есть в БД'
+    unique_error_field = 'slug'
 
     class Meta:
         model = Category
@@ -27,17 +58,11 @@ class CategorySerializer(serializers.ModelSerializer):
         )
 
 
-class GenreSerializer(serializers.ModelSerializer):
+class GenreSerializer(UniqueConstraintMixin, serializers.ModelSerializer):
 
-    slug = serializers.SlugField(
-        max_length=50,
-        validators=[
-            UniqueValidator(
-                queryset=Genre.objects.all(),
-                message='Указанный жанр уже есть в БД',
-            )
-        ],
-    )
+    slug = serializers.SlugField(max_length=50, validators=[])
+    unique_error_message = 'Указанный жанр уже есть в БД'
+    unique_error_field = 'slug'
 
     class Meta:
         model = Genre
@@ -65,7 +90,7 @@ class ReadOnlyTitleSerializer(serializers.ModelSerializer):
         )
 
 
-class TitleSerializer(serializers.ModelSerializer):
+class TitleSerializer(UniqueConstraintMixin, serializers.ModelSerializer):
     genre = serializers.SlugRelatedField(
         many=True, slug_field='slug', queryset=Genre.objects.all()
     )
@@ -74,6 +99,7 @@ class TitleSerializer(serializers.ModelSerializer):
     )
 
     year = serializers.IntegerField(validators=[validate_not_future_year])
+    unique_error_message = 'Такое произведение уже существует в БД'
 
     class Meta:
         model = Title
@@ -85,52 +111,75 @@ class TitleSerializer(serializers.ModelSerializer):
             'genre',
             'category',
         )
-        validators = [
-            UniqueTogetherValidator(
-                queryset=Title.objects.all(),
-                fields=('name', 'year', 'category'),
-                message='Такое произведение уже существует в БД',
-            )
-        ]
 
     def create(self, validated_data):
         genres = validated_data.pop('genre')
         title = Title.objects.create(**validated_data)
-        for genre in genres:
-            GenreTitle.objects.create(genre=genre, title=title)
+        GenreTitle.objects.bulk_create(
+            GenreTitle(genre=genre, title=title) for genre in genres
+        )
         return title
 
     def update(self, instance, validated_data):
-        genres = (
-            validated_data.pop('genre') if 'genre' in validated_data else []
-        )
+        genres = validated_data.pop('genre', None)
 
         # setting new values to model instance
         for fieldname, value in validated_data.items():
             setattr(instance, fieldname, value)
 
-        # delete all current genres-title entries and add new ones
-        GenreTitle.objects.filter(title=instance).delete()
-        for genre in genres:
-            current_genre = Genre.objects.get(**genre)
-            GenreTitle.objects.create(genre=current_genre, title=instance)
-
-        # saving updates to db and return updated instance
+        # saving updates to db
         instance.save()
+
+        # sync genres-title entries: drop removed genres, add new ones
+        if genres is not None:
+            current = set(
+                GenreTitle.objects.filter(title=instance).values_list(
+                    'genre_id', flat=True
+                )
+            )
+            updated = {genre.pk for genre in genres}
+            GenreTitle.objects.filter(
+                title=instance, genre_id__in=current - updated
+            ).delete()
+            GenreTitle.objects.bulk_create(
+                GenreTitle(genre_id=genre_id, title=instance)
+                for genre_id in updated - current
+            )
         return instance
 
 
-class RegisterSerializer(serializers.ModelSerializer):
+class RegisterSerializer(UniqueConstraintMixin, serializers.ModelSerializer):
     '''
     Serializer for registration new users.
     '''
 
+    unique_error_message = (
+        'Пользователь с таким username или email уже существует.'
+    )
+
     class Meta:
         model = User
         fields = ('email', 'username')
-        validators = [
-            UniqueTogetherValidator(User.objects.all(), ('email', 'username'))
-        ]
+        extra_kwargs = {
+            'email': {'validators': []},
+            'username': {'validators': []},
+        }
+
+    def get_unique_error(self, error):
+        '''
+        Report the field that is already taken, with the same message
+        model field unique validator would give.
+        '''
+        for fieldname in ('username', 'email'):
+            value = self.validated_data[fieldname]
+            if User.objects.filter(**{fieldname: value}).exists():
+                model_field = User._meta.get_field(fieldname)
+                message = model_field.error_messages['unique'] % {
+                    'model_name': User._meta.verbose_name,
+                    'field_label': model_field.verbose_name,
+                }
+                return {fieldname: [message]}
+        return super().get_unique_error(error)
 
     def validate_username(self, value):
         '''
@@ -160,11 +209,26 @@ class ObtainTokenSerializer(serializers.Serializer):
         '''
         Checking that user entered right confirmation_code.
         '''
-        user = get_object_or_404(User, username=data.get('username'))
-        if data.get('confirmation_code') != user.confirmation_code:
+        user = get_object_or_404(
+            User.objects.only(
+                'id', 'username', 'confirmation_code', 'confirmation_attempts'
+            ),
+            username=data.get('username'),
+        )
+        if user.confirmation_attempts >= CONFIRMATION_CODE_MAX_ATTEMPTS:
+            raise serializers.ValidationError(
+                'Превышено число попыток ввода проверочного кода. '
+                'Запросите новый код.'
+            )
+        if not user.check_confirmation_code(data.get('confirmation_code')):
+            User.objects.filter(pk=user.pk).update(
+                confirmation_attempts=F('confirmation_attempts') + 1
+            )
             raise serializers.ValidationError(
                 'Введен неверный' ' проверочный код.'
             )
+        # keep the user so the view can issue a token without refetching it
+        self.user = user
         return data
 
 
@@ -195,37 +259,18 @@ class SelfProfileSerializer(serializers.ModelSerializer):
         read_only_fields = ('role',)
 
 
-class CreateTitleDefault(object):
-    requires_context = True
-
-    def __call__(self, serializer_field):
-        view = serializer_field.context['view']
-        title_id = view.kwargs.get('title_id')
-        title = get_object_or_404(Title, pk=title_id)
-        return title
-
-
-class ReviewSerializer(serializers.ModelSerializer):
+class ReviewSerializer(UniqueConstraintMixin, serializers.ModelSerializer):
     author = serializers.SlugRelatedField(
         slug_field='username',
         read_only=True,
         default=serializers.CurrentUserDefault(),
     )
     score = serializers.IntegerField(min_value=1, max_value=10)
-    title = serializers.HiddenField(
-        default=serializers.CreateOnlyDefault(CreateTitleDefault())
-    )
+    unique_error_message = 'Ревью оставлять можно только один раз'
 
     class Meta:
         model = Review
-        fields = ('id', 'text', 'author', 'score', 'pub_date', 'title')
-        validators = [
-            UniqueTogetherValidator(
-                queryset=Review.objects.all(),
-                fields=['author', 'title'],
-                message="Ревью оставлять можно только один раз",
-            )
-        ]
+        fields = ('id', 'text', 'author', 'score', 'pub_date')
 
 
 class CommentSerializer(serializers.ModelSerializer):
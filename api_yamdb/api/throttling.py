@@ -0,0 +1,28 @@
+import hashlib
+
+from rest_framework.throttling import SimpleRateThrottle
+
+
+class UsernameRateThrottle(SimpleRateThrottle):
+    """
+    Limits requests for the username from request data, whatever
+    address they come from, so one account can't be attacked through
+    many clients.
+    """
+
+    def get_cache_key(self, request, view):
+        username = request.data.get('username')
+        if not username:
+            return None
+        return self.cache_format % {
+            'scope': self.scope,
+            'ident': hashlib.md5(str(username).encode()).hexdigest(),
+        }
+
+
+class SignupUsernameRateThrottle(UsernameRateThrottle):
+    scope = 'signup_username'
+
+
+class TokenUsernameRateThrottle(UsernameRateThrottle):
+    scope = 'auth_token_username'
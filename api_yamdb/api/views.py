@@ -1,8 +1,5 @@
-import uuid
-
-from django.core.mail import send_mail
-from django.db.models import Avg
-from django.shortcuts import get_object_or_404
+from django.conf import settings
+from django.core.cache import cache
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework import (
     filters,
@@ -13,16 +10,21 @@ from rest_framework import (
     viewsets,
 )
 from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
 from rest_framework.pagination import PageNumberPagination
 from rest_framework.response import Response
+from rest_framework.settings import api_settings
+from rest_framework.throttling import ScopedRateThrottle
 from rest_framework_simplejwt.tokens import RefreshToken
 
+from .emails import send_confirmation_email
 from .filters import TitleFilter
-from .mixins import ListCreateDestroyViewSet
+from .mixins import ListCreateDestroyViewSet, ParentObjectMixin
+from .pagination import PubDatePaginationMixin
 from .permissions import (
     IsAdmin,
     IsAuthor,
-    IsModerator,
+    IsAuthorOrStaff,
     IsReadOnly,
     IsSuperuser,
 )
@@ -38,8 +40,17 @@ from .serializers import (
     TitleSerializer,
     UsersManageSerializer,
 )
+from .throttling import (
+    SignupUsernameRateThrottle,
+    TokenUsernameRateThrottle,
+)
 from reviews.models import Category, Genre, Review, Title
-from users.models import User
+from users.cache import get_users_list_cache_key
+from users.models import (
+    User,
+    generate_confirmation_code,
+    hash_confirmation_code,
+)
 
 
 class RegisterViewSet(mixins.CreateModelMixin, viewsets.GenericViewSet):
@@ -50,39 +61,40 @@ class RegisterViewSet(mixins.CreateModelMixin, viewsets.GenericViewSet):
     '''
 
     serializer_class = RegisterSerializer
+    throttle_classes = (ScopedRateThrottle, SignupUsernameRateThrottle)
+    throttle_scope = 'signup'
 
     def create(self, request, *args, **kwargs):
         #  User can get email with confirmation code after
         #  entering valid username and email.
-        try:
-            user = User.objects.filter(
-                username=request.data['username'], email=request.data['email']
-            )[0]
-            send_mail(
-                'E-mail verification',
-                f'Your confirmation_code is {user.confirmation_code}',
-                'register@yamdb.ru',
-                [request.data['email']],
+        #  Only a hash of the code is stored, so existing user gets a new one.
+        confirmation_code = generate_confirmation_code()
+        updated = User.objects.filter(
+            username=request.data.get('username'),
+            email=request.data.get('email'),
+        ).update(
+            confirmation_code=hash_confirmation_code(confirmation_code),
+            confirmation_attempts=0,
+        )
+        if updated:
+            send_confirmation_email(
+                request.data.get('email'), confirmation_code
             )
             return Response(request.data, status=status.HTTP_200_OK)
-        except Exception:
-            serializer = self.get_serializer(data=request.data)
-            serializer.is_valid(raise_exception=True)
-            self.perform_create(serializer)
-            headers = self.get_success_headers(serializer.data)
-            return Response(
-                serializer.data, status=status.HTTP_200_OK, headers=headers
-            )
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        self.perform_create(serializer)
+        headers = self.get_success_headers(serializer.data)
+        return Response(
+            serializer.data, status=status.HTTP_200_OK, headers=headers
+        )
 
     def perform_create(self, serializer):
-        confirmation_code = str(uuid.uuid4())
-        serializer.save(confirmation_code=confirmation_code)
-        send_mail(
-            'E-mail verification',
-            f'Your confirmation_code is {confirmation_code}',
-            'register@yamdb.ru',
-            [serializer.data['email']],
+        confirmation_code = generate_confirmation_code()
+        serializer.save(
+            confirmation_code=hash_confirmation_code(confirmation_code)
         )
+        send_confirmation_email(serializer.data['email'], confirmation_code)
 
 
 class ObtainTokenView(views.APIView):
@@ -91,11 +103,26 @@ class ObtainTokenView(views.APIView):
     and "confirmation code".
     '''
 
+    throttle_classes = (ScopedRateThrottle, TokenUsernameRateThrottle)
+    throttle_scope = 'auth_token'
+
     def post(self, request):
         serializer = ObtainTokenSerializer(data=request.data)
         serializer.is_valid(raise_exception=True)
-        username = serializer.data.get('username')
-        user = get_object_or_404(User, username=username)
+        user = serializer.user
+        # confirmation code can be used only once: clear it, unless
+        # a concurrent request has already done it
+        used = User.objects.filter(
+            pk=user.pk, confirmation_code=user.confirmation_code
+        ).update(confirmation_code='', confirmation_attempts=0)
+        if not used:
+            raise ValidationError(
+                {
+                    api_settings.NON_FIELD_ERRORS_KEY: [
+                        'Проверочный код уже использован.'
+                    ]
+                }
+            )
         token = RefreshToken.for_user(user).access_token
         return Response({'token': str(token)}, status=status.HTTP_200_OK)
 
@@ -106,12 +133,33 @@ class UsersManageViewSet(viewsets.ModelViewSet):
     lookup_field = 'username'
     pagination_class = PageNumberPagination
     permission_classes = [
-        permissions.IsAuthenticated & (IsAdmin | IsSuperuser)
+        permissions.IsAuthenticated & (IsSuperuser | IsAdmin)
     ]
 
+    def get_queryset(self):
+        if self.action == 'list':
+            # list needs only serialized columns, not password hash etc.
+            return User.objects.only(*UsersManageSerializer.Meta.fields)
+        return super().get_queryset()
+
+    def list(self, request, *args, **kwargs):
+        # users list is cached for a short time, any user change resets it
+        timeout = settings.USERS_LIST_CACHE_TIMEOUT
+        if not timeout:
+            return super().list(request, *args, **kwargs)
+        key = get_users_list_cache_key(request)
+        data = cache.get(key)
+        if data is None:
+            data = super().list(request, *args, **kwargs).data
+            cache.set(key, data, timeout)
+        return Response(data)
+
     def perform_create(self, serializer):
-        confirmation_code = str(uuid.uuid4())
-        serializer.save(confirmation_code=confirmation_code)
+        serializer.save(
+            confirmation_code=hash_confirmation_code(
+                generate_confirmation_code()
+            )
+        )
 
     @action(
         methods=['get', 'patch'],
@@ -119,9 +167,8 @@ class UsersManageViewSet(viewsets.ModelViewSet):
         permission_classes=[permissions.IsAuthenticated],
     )
     def me(self, request):
-        profile = User.objects.get(pk=request.user.id)
         if request.method == "GET":
-            serializer = SelfProfileSerializer(profile)
+            serializer = SelfProfileSerializer(request.user)
             return Response(serializer.data, status=status.HTTP_200_OK)
         serializer = SelfProfileSerializer(
             request.user, data=self.request.data, partial=True
@@ -134,10 +181,10 @@ class UsersManageViewSet(viewsets.ModelViewSet):
 class SlugNameViewSet(ListCreateDestroyViewSet):
     lookup_field = 'slug'
     permission_classes = [
-        (permissions.IsAuthenticated & (IsAdmin | IsSuperuser)) | IsReadOnly
+        (permissions.IsAuthenticated & (IsSuperuser | IsAdmin)) | IsReadOnly
     ]
     filter_backends = (filters.SearchFilter,)
-    search_fields = ('$name',)
+    search_fields = ('^name',)
     pagination_class = PageNumberPagination
 
 
@@ -152,9 +199,13 @@ class GenreViewSet(SlugNameViewSet):
 
 
 class TitleViewSet(viewsets.ModelViewSet):
-    queryset = Title.objects.all().annotate(rating=Avg('reviews__score'))
+    queryset = (
+        Title.objects.all()
+        .select_related('category')
+        .prefetch_related('genre')
+    )
     permission_classes = [
-        (permissions.IsAuthenticated & (IsAdmin | IsSuperuser)) | IsReadOnly
+        (permissions.IsAuthenticated & (IsSuperuser | IsAdmin)) | IsReadOnly
     ]
     filter_backends = (DjangoFilterBackend,)
     filter_class = TitleFilter
@@ -166,18 +217,17 @@ class TitleViewSet(viewsets.ModelViewSet):
         return ReadOnlyTitleSerializer
 
 
-class ReviewViewSet(viewsets.ModelViewSet):
+class ReviewViewSet(
+    ParentObjectMixin, PubDatePaginationMixin, viewsets.ModelViewSet
+):
     serializer_class = ReviewSerializer
-    pagination_class = PageNumberPagination
+    parent_model = Title
+    parent_url_kwarg = 'title_id'
+    parent_field = 'title'
 
     def get_permissions(self):
         if self.action in ['partial_update', 'destroy']:
-            permission_classes = [
-                (
-                    permissions.IsAuthenticated
-                    & (IsAuthor | IsModerator | IsAdmin | IsSuperuser)
-                )
-            ]
+            permission_classes = [IsAuthorOrStaff]
         else:
             permission_classes = [
                 (permissions.IsAuthenticated & IsAuthor) | IsReadOnly
@@ -185,37 +235,26 @@ class ReviewViewSet(viewsets.ModelViewSet):
 
         return [permission() for permission in permission_classes]
 
-    def perform_create(self, serializer):
-        title = get_object_or_404(Title, pk=self.kwargs.get('title_id'))
-        serializer.save(title=title, author=self.request.user)
-
     def get_queryset(self):
-        title = get_object_or_404(Title, pk=self.kwargs.get('title_id'))
-        return title.reviews.all()
+        return self.get_parent().reviews.select_related('author')
 
 
-class CommentViewSet(viewsets.ModelViewSet):
+class CommentViewSet(
+    ParentObjectMixin, PubDatePaginationMixin, viewsets.ModelViewSet
+):
     serializer_class = CommentSerializer
-    pagination_class = PageNumberPagination
+    parent_model = Review
+    parent_url_kwarg = 'review_id'
+    parent_field = 'review'
 
     def get_permissions(self):
         if self.action in ['partial_update', 'destroy']:
-            permission_classes = [
-                (
-                    permissions.IsAuthenticated
-                    & (IsAuthor | IsModerator | IsAdmin | IsSuperuser)
-                )
-            ]
+            permission_classes = [IsAuthorOrStaff]
         else:
             permission_classes = [
                 (permissions.IsAuthenticated & IsAuthor) | IsReadOnly
             ]
         return [permission() for permission in permission_classes]
 
-    def perform_create(self, serializer):
-        review = get_object_or_404(Review, pk=self.kwargs.get('review_id'))
-        serializer.save(review=review, author=self.request.user)
-
     def get_queryset(self):
-        review = get_object_or_404(Review, pk=self.kwargs.get('review_id'))
-        return review.comments.all()
+        return self.get_parent().comments.select_related('author')
@@ -124,8 +124,28 @@ REST_FRAMEWORK = {
     ),
     'DEFAULT_PAGINATION_CLASS': 'rest_framework.pagination.PageNumberPagination',
     'PAGE_SIZE': 10,
+    'DEFAULT_THROTTLE_RATES': {
+        'signup': '10/hour',
+        'signup_username': '3/hour',
+        'auth_token': '10/minute',
+        'auth_token_username': '10/hour',
+    },
+    # Clients are identified by REMOTE_ADDR, X-Forwarded-For is ignored as
+    # it can be forged. Set to the number of trusted proxies in front of
+    # the app when running behind them.
+    'NUM_PROXIES': 0,
 }
 
+# Users list cache timeout in seconds, 0 disables the cache.
+# Any user change resets the cache, but with the default per-process
+# LocMemCache this is seen only by the worker that made the change: other
+# workers may serve a stale list until the timeout expires. Configure
+# a shared CACHES backend (Redis, Memcached) when running several workers.
+USERS_LIST_CACHE_TIMEOUT = 30
+
+# Use cursor pagination (no `count` field) for reviews and comments lists
+REVIEWS_CURSOR_PAGINATION = False
+
 SIMPLE_JWT = {
     'ACCESS_TOKEN_LIFETIME': timedelta(days=1),
     'ALGORITHM': 'HS256',
@@ -137,6 +157,8 @@ SIMPLE_JWT = {
 
 EMAIL_BACKEND = 'django.core.mail.backends.filebased.EmailBackend'
 EMAIL_FILE_PATH = os.path.join(BASE_DIR, 'sent_emails')
+# Send confirmation emails in a background thread
+EMAIL_ASYNC = True
 
 SWAGGER_SETTINGS = {
     'SECURITY_DEFINITIONS': {
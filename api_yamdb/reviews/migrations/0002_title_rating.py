@@ -0,0 +1,35 @@
+# Generated by Django 2.2.16 on 2026-10-15 01:28
+
+from django.db import migrations, models
+from django.db.models import Avg, Count
+
+
+def fill_title_rating(apps, schema_editor):
+    Title = apps.get_model('reviews', 'Title')
+    for title in Title.objects.annotate(
+        avg=Avg('reviews__score'), count=Count('reviews')
+    ):
+        title.rating = title.avg
+        title.rating_count = title.count
+        title.save(update_fields=('rating', 'rating_count'))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reviews', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='title',
+            name='rating',
+            field=models.FloatField(editable=False, null=True, verbose_name='рейтинг'),
+        ),
+        migrations.AddField(
+            model_name='title',
+            name='rating_count',
+            field=models.PositiveIntegerField(default=0, editable=False, verbose_name='число оценок'),
+        ),
+        migrations.RunPython(fill_title_rating, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 2.2.16 on 2026-10-15 01:29
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reviews', '0002_title_rating'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='comment',
+            index=models.Index(fields=['review', '-pub_date'], name='comment_review_date'),
+        ),
+        migrations.AddIndex(
+            model_name='review',
+            index=models.Index(fields=['title', '-pub_date'], name='review_title_date'),
+        ),
+    ]
@@ -0,0 +1,35 @@
+from django.db import migrations
+
+# SearchFilter with '^name' runs istartswith lookup, which on PostgreSQL is
+# UPPER("name"::text) LIKE UPPER('...%'). Trigram GIN index over the same
+# expression lets it use an index scan instead of a full table scan.
+TABLES = ('reviews_category', 'reviews_genre')
+
+
+def create_trgm_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    for table in TABLES:
+        schema_editor.execute(
+            f'CREATE INDEX IF NOT EXISTS {table}_name_trgm ON {table} '
+            f'USING gin ((UPPER("name"::text)) gin_trgm_ops)'
+        )
+
+
+def drop_trgm_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for table in TABLES:
+        schema_editor.execute(f'DROP INDEX IF EXISTS {table}_name_trgm')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reviews', '0003_review_comment_pub_date_indexes'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_trgm_indexes, drop_trgm_indexes),
+    ]
@@ -45,6 +45,11 @@ class Title(models.Model):
         on_delete=models.SET_NULL,
         null=True,
     )
+    # denormalized average score of title reviews, kept in sync by signals
+    rating = models.FloatField('рейтинг', null=True, editable=False)
+    rating_count = models.PositiveIntegerField(
+        'число оценок', default=0, editable=False
+    )
 
     class Meta:
         ordering = ('-year',)
@@ -91,6 +96,11 @@ class Review(models.Model):
                 fields=['author', 'title'], name='unique_review'
             )
         ]
+        indexes = [
+            models.Index(
+                fields=['title', '-pub_date'], name='review_title_date'
+            ),
+        ]
 
     def __str__(self):
         return f'{self.title} {self.text[:15]}'
@@ -110,6 +120,11 @@ class Comment(models.Model):
         ordering = [
             'pub_date',
         ]
+        indexes = [
+            models.Index(
+                fields=['review', '-pub_date'], name='comment_review_date'
+            ),
+        ]
 
     def __str__(self):
         return f'{self.review} {self.text[:15]}'
@@ -0,0 +1,34 @@
+from django.db.models import Avg, Count, IntegerField, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .models import Review, Title
+
+
+def update_title_rating(title_id):
+    """
+    Recalculates denormalized rating and rating_count of the title
+    with a single UPDATE query.
+    """
+    reviews = (
+        Review.objects.filter(title_id=OuterRef('pk'))
+        .order_by()
+        .values('title_id')
+    )
+    Title.objects.filter(pk=title_id).update(
+        rating=Subquery(reviews.annotate(avg=Avg('score')).values('avg')),
+        rating_count=Coalesce(
+            Subquery(
+                reviews.annotate(count=Count('pk')).values('count'),
+                output_field=IntegerField(),
+            ),
+            0,
+        ),
+    )
+
+
+@receiver(post_save, sender=Review)
+@receiver(post_delete, sender=Review)
+def review_changed(sender, instance, **kwargs):
+    update_title_rating(instance.title_id)
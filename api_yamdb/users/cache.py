@@ -0,0 +1,28 @@
+import hashlib
+
+from django.core.cache import cache
+
+USERS_LIST_VERSION_KEY = 'users_list:version'
+
+
+def get_users_list_cache_key(request):
+    """
+    Builds cache key for users list page requested by the request user.
+    Key includes version which is bumped on every user change, so all
+    cached pages become stale at once without deleting keys by pattern.
+    The path is hashed as memcached rejects long keys and keys with
+    spaces or control characters.
+    """
+    version = cache.get_or_set(USERS_LIST_VERSION_KEY, 1, None)
+    path = hashlib.md5(request.get_full_path().encode()).hexdigest()
+    return (
+        f'users_list:{version}:{request.user.pk}:{request.user.role}:{path}'
+    )
+
+
+def invalidate_users_list():
+    try:
+        cache.incr(USERS_LIST_VERSION_KEY)
+    except ValueError:
+        # no version stored yet, so nothing is cached either
+        pass
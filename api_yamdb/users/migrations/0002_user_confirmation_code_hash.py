@@ -0,0 +1,18 @@
+# Generated by Django 2.2.16 on 2026-10-15 01:29
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='user',
+            name='confirmation_code',
+            field=models.CharField(default='', max_length=64),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 2.2.16 on 2026-10-15 01:38
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0002_user_confirmation_code_hash'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='user',
+            name='confirmation_attempts',
+            field=models.PositiveSmallIntegerField(default=0),
+        ),
+    ]
@@ -1,7 +1,12 @@
+import hashlib
+import hmac
+import secrets
 from enum import Enum
 
+from django.conf import settings
 from django.contrib.auth.models import AbstractUser
 from django.db import models
+from django.utils.crypto import constant_time_compare
 
 
 class ROLES(Enum):
@@ -17,6 +22,24 @@ class ROLES(Enum):
         return self.name
 
 
+ROLE_CHOICES = ROLES.get_roles()
+USER_ROLE = ROLES.user.name
+MOD_ROLE = ROLES.moderator.name
+ADMIN_ROLE = ROLES.admin.name
+
+CONFIRMATION_CODE_MAX_ATTEMPTS = 5
+
+
+def generate_confirmation_code():
+    return f'{secrets.randbelow(10 ** 6):06d}'
+
+
+def hash_confirmation_code(code):
+    return hmac.new(
+        settings.SECRET_KEY.encode(), str(code).encode(), hashlib.sha256
+    ).hexdigest()[:32]
+
+
 class User(AbstractUser):
     username = models.CharField(max_length=25,
                                 unique=True)
@@ -26,10 +49,20 @@ class User(AbstractUser):
                            verbose_name='О себе',
                            )
     role = models.CharField(max_length=20,
-                            choices=ROLES.get_roles(),
-                            default='user',
+                            choices=ROLE_CHOICES,
+                            default=USER_ROLE,
                             verbose_name='Роль')
-    confirmation_code = models.CharField(max_length=50,
+    # only a hash of the code is stored, the code itself is emailed
+    confirmation_code = models.CharField(max_length=64,
                                          default='')
+    # failed attempts to enter current confirmation code
+    confirmation_attempts = models.PositiveSmallIntegerField(default=0)
 
     USERNAME_FIELD = 'username'
+
+    def check_confirmation_code(self, code):
+        if not self.confirmation_code:
+            return False
+        return constant_time_compare(
+            self.confirmation_code, hash_confirmation_code(code)
+        )
@@ -0,0 +1,11 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .cache import invalidate_users_list
+from .models import User
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def invalidate_users_list_cache(sender, **kwargs):
+    invalidate_users_list()
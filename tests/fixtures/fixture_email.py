@@ -0,0 +1,6 @@
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def sync_email(settings):
+    settings.EMAIL_ASYNC = False
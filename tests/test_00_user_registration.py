@@ -279,3 +279,122 @@ class Test00UserRegistration:
             f'Проверьте, что при {request_type} запросе `{self.url_signup}` нельзя создать '
             f'пользователя, username которого уже зарегистрирован и возвращается статус {code}'
         )
+
+    @pytest.mark.django_db
+    def test_00_registration_taken_field_error(self, client, admin):
+        response = client.post(self.url_signup,
+                               data={'username': admin.username, 'email': 'other@yamdb.fake'})
+        assert response.status_code == 400 and list(response.json()) == ['username'], (
+            f'Проверьте, что при POST запросе `{self.url_signup}` с занятым username '
+            'возвращается ошибка поля `username`'
+        )
+        response = client.post(self.url_signup,
+                               data={'username': 'other', 'email': admin.email})
+        assert response.status_code == 400 and list(response.json()) == ['email'], (
+            f'Проверьте, что при POST запросе `{self.url_signup}` с занятым email '
+            'возвращается ошибка поля `email`'
+        )
+
+    def test_00_async_email_failure_logged(self, settings, monkeypatch, caplog):
+        from concurrent.futures import ThreadPoolExecutor
+
+        from api import emails
+
+        def fail(*args, **kwargs):
+            raise ConnectionRefusedError('SMTP server is down')
+
+        settings.EMAIL_ASYNC = True
+        executor = ThreadPoolExecutor(max_workers=1)
+        monkeypatch.setattr(emails, 'send_mail', fail)
+        monkeypatch.setattr(emails, '_executor', executor)
+        with caplog.at_level('ERROR', logger='api.emails'):
+            emails.send_confirmation_email('valid@yamdb.fake', '123456')
+            executor.shutdown(wait=True)
+        assert 'Failed to send confirmation email' in caplog.text, (
+            'Проверьте, что ошибка фоновой отправки письма записывается в лог'
+        )
+
+    @pytest.mark.django_db
+    def test_00_obtain_jwt_token_with_emailed_code(self, client):
+        data = {'username': 'valid-username', 'email': 'valid@yamdb.fake'}
+        client.post(self.url_signup, data=data)
+        code = mail.outbox[-1].body.split()[-1]
+        assert len(code) == 6 and code.isdigit(), (
+            'Проверьте, что код подтверждения состоит из 6 цифр'
+        )
+        response = client.post(self.url_token, data={'username': data['username'],
+                                                     'confirmation_code': code})
+        assert response.status_code == 200 and 'token' in response.json(), (
+            'Проверьте, что по коду подтверждения из письма можно получить токен'
+        )
+        client.post(self.url_signup, data=data)
+        new_code = mail.outbox[-1].body.split()[-1]
+        response = client.post(self.url_token, data={'username': data['username'],
+                                                     'confirmation_code': new_code})
+        assert response.status_code == 200, (
+            'Проверьте, что по повторно отправленному коду подтверждения можно получить токен'
+        )
+
+    @pytest.mark.django_db
+    def test_00_confirmation_code_attempts(self, client):
+        data = {'username': 'valid-username', 'email': 'valid@yamdb.fake'}
+        client.post(self.url_signup, data=data)
+        code = mail.outbox[-1].body.split()[-1]
+        wrong_code = f'{(int(code) + 1) % 10 ** 6:06d}'
+        for _ in range(5):
+            client.post(self.url_token, data={'username': data['username'],
+                                              'confirmation_code': wrong_code})
+        response = client.post(self.url_token, data={'username': data['username'],
+                                                     'confirmation_code': code})
+        assert response.status_code == 400, (
+            'Проверьте, что после нескольких неверных попыток проверочный код перестает действовать'
+        )
+        client.post(self.url_signup, data=data)
+        code = mail.outbox[-1].body.split()[-1]
+        token_data = {'username': data['username'], 'confirmation_code': code}
+        response = client.post(self.url_token, data=token_data)
+        assert response.status_code == 200, (
+            'Проверьте, что новый проверочный код позволяет получить токен'
+        )
+        response = client.post(self.url_token, data=token_data)
+        assert response.status_code == 400, (
+            'Проверьте, что проверочный код нельзя использовать повторно'
+        )
+
+    @pytest.mark.django_db
+    def test_00_auth_throttling(self, client):
+        statuses = [client.post(self.url_signup).status_code for _ in range(11)]
+        assert statuses[-1] == 429, (
+            'Проверьте, что частота запросов к `/api/v1/auth/signup/` ограничена'
+        )
+        statuses = [client.post(self.url_token).status_code for _ in range(11)]
+        assert statuses[-1] == 429, (
+            'Проверьте, что частота запросов к `/api/v1/auth/token/` ограничена'
+        )
+
+    @pytest.mark.django_db
+    def test_00_auth_throttling_spoofed_ip(self, client):
+        statuses = [
+            client.post(
+                self.url_signup, HTTP_X_FORWARDED_FOR=f'10.0.0.{i}'
+            ).status_code
+            for i in range(11)
+        ]
+        assert statuses[-1] == 429, (
+            'Проверьте, что ограничение частоты запросов к `/api/v1/auth/signup/` '
+            'нельзя обойти подменой заголовка `X-Forwarded-For`'
+        )
+
+    @pytest.mark.django_db
+    def test_00_auth_throttling_by_username(self, client):
+        data = {'username': 'valid_username', 'confirmation_code': '000000'}
+        statuses = [
+            client.post(
+                self.url_token, data=data, REMOTE_ADDR=f'10.0.0.{i}'
+            ).status_code
+            for i in range(11)
+        ]
+        assert statuses[-1] == 429, (
+            'Проверьте, что попытки получения токена ограничены для '
+            'пользователя, а не только для IP-адреса'
+        )
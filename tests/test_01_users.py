@@ -571,3 +571,19 @@ class Test01UserAPI:
             'Проверьте, что при PATCH запросе `/api/v1/users/me/`, '
             'пользователь с ролью user не может сменить себе роль'
         )
+
+    @pytest.mark.django_db
+    def test_12_users_list_cache_long_query(self, admin_client):
+        import warnings
+
+        from django.core.cache.backends.base import CacheKeyWarning
+
+        with warnings.catch_warnings():
+            warnings.simplefilter('error', CacheKeyWarning)
+            response = admin_client.get(
+                '/api/v1/users/', {'search': 'a b' * 100}
+            )
+        assert response.status_code == 200, (
+            'Проверьте, что GET запрос `/api/v1/users/` с длинными параметрами '
+            'поиска кэшируется под допустимым ключом'
+        )
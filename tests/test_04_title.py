@@ -1,6 +1,6 @@
 import pytest
 
-from .common import (auth_client, create_categories, create_genre,
+from .common import (auth_client, create_categories, create_genre, create_reviews,
                      create_titles, create_users_api)
 
 
@@ -249,3 +249,50 @@ class Test04TitleAPI:
         user, moderator = create_users_api(admin_client)
         self.check_permissions(user, 'обычного пользователя', titles, categories, genres)
         self.check_permissions(moderator, 'модератора', titles, categories, genres)
+
+    @pytest.mark.django_db
+    def test_05_title_duplicate_error(self, admin_client):
+        titles, _, genres = create_titles(admin_client)
+        data = {'name': titles[0]['name'], 'year': titles[0]['year'],
+                'genre': [genres[0]['slug']], 'category': titles[0]['category']}
+        response = admin_client.post('/api/v1/titles/', data=data)
+        assert response.status_code == 400 and 'non_field_errors' in response.json(), (
+            'Проверьте, что при POST запросе `/api/v1/titles/` с уже существующим произведением '
+            'возвращается статус 400 и ошибка в `non_field_errors`'
+        )
+
+    @pytest.mark.django_db
+    def test_06_title_update_genres(self, admin_client):
+        titles, _, genres = create_titles(admin_client)
+        url = f'/api/v1/titles/{titles[0]["id"]}/'
+        data = {'genre': [genres[1]['slug'], genres[2]['slug']]}
+        response = admin_client.patch(url, data=data)
+        assert response.status_code == 200, (
+            'Проверьте, что при PATCH запросе `/api/v1/titles/{titles_id}/` возвращается статус 200'
+        )
+        assert sorted(response.json().get('genre')) == sorted(data['genre']), (
+            'Проверьте, что при PATCH запросе `/api/v1/titles/{titles_id}/` жанры произведения обновляются'
+        )
+        response = admin_client.patch(url, data={'description': 'Новое описание'})
+        genre_slugs = [genre['slug'] for genre in admin_client.get(url).json()['genre']]
+        assert sorted(genre_slugs) == sorted(data['genre']), (
+            'Проверьте, что при PATCH запросе `/api/v1/titles/{titles_id}/` без жанров '
+            'жанры произведения не меняются'
+        )
+
+    @pytest.mark.django_db
+    def test_07_title_rating(self, client, admin_client, admin):
+        reviews, titles, _, _ = create_reviews(admin_client, admin)
+        url = f'/api/v1/titles/{titles[0]["id"]}/'
+        assert client.get(url).json().get('rating') == 4, (
+            'Проверьте, что `rating` произведения равен среднему значению оценок отзывов'
+        )
+        admin_client.patch(f'{url}reviews/{reviews[0]["id"]}/', data={'score': 8})
+        assert client.get(url).json().get('rating') == 5, (
+            'Проверьте, что `rating` произведения пересчитывается при изменении оценки отзыва'
+        )
+        for review in reviews:
+            admin_client.delete(f'{url}reviews/{review["id"]}/')
+        assert client.get(url).json().get('rating') is None, (
+            'Проверьте, что `rating` произведения без отзывов равен `None`'
+        )
@@ -334,3 +334,68 @@ class Test05ReviewAPI:
             'без токена авторизации возвращается статус 401'
         )
         self.check_permissions(user, 'обычного пользователя', reviews, titles)
+
+    @pytest.mark.django_db
+    def test_05_reviews_edit_by_moderator(self, admin_client, admin):
+        reviews, titles, user, moderator = create_reviews(admin_client, admin)
+        client_user = auth_client(user)
+        client_moderator = auth_client(moderator)
+        url = f'/api/v1/titles/{titles[0]["id"]}/reviews/'
+        response = client_user.patch(f'{url}{reviews[2]["id"]}/', data={'text': 'new'})
+        assert response.status_code == 403, (
+            'Проверьте, что при PATCH запросе `/api/v1/titles/{title_id}/reviews/{review_id}/` '
+            'пользователь не может изменить чужой отзыв'
+        )
+        response = client_user.delete(f'{url}{reviews[0]["id"]}/')
+        assert response.status_code == 403, (
+            'Проверьте, что при DELETE запросе `/api/v1/titles/{title_id}/reviews/{review_id}/` '
+            'пользователь не может удалить чужой отзыв'
+        )
+        response = client_moderator.patch(f'{url}{reviews[1]["id"]}/', data={'text': 'new'})
+        assert response.status_code == 200, (
+            'Проверьте, что при PATCH запросе `/api/v1/titles/{title_id}/reviews/{review_id}/` '
+            'модератор может изменить чужой отзыв'
+        )
+        response = client_moderator.delete(f'{url}{reviews[0]["id"]}/')
+        assert response.status_code == 204, (
+            'Проверьте, что при DELETE запросе `/api/v1/titles/{title_id}/reviews/{review_id}/` '
+            'модератор может удалить чужой отзыв'
+        )
+
+    @pytest.mark.django_db
+    def test_06_review_missing_title(self, admin_client):
+        from reviews.models import Review
+
+        url = '/api/v1/titles/999/reviews/'
+        response = admin_client.post(url, data={'text': 'qwerty', 'score': 5})
+        assert response.status_code == 404, (
+            'Проверьте, что при POST запросе `/api/v1/titles/{title_id}/reviews/` '
+            'с не существующим title_id возвращается статус 404'
+        )
+        assert not Review.objects.filter(title_id=999).exists(), (
+            'Проверьте, что при POST запросе `/api/v1/titles/{title_id}/reviews/` '
+            'с не существующим title_id отзыв не создается'
+        )
+        response = admin_client.post(url, data={'score': 11})
+        assert response.status_code == 404, (
+            'Проверьте, что при POST запросе `/api/v1/titles/{title_id}/reviews/` '
+            'с не существующим title_id и неверными данными возвращается статус 404'
+        )
+
+    @pytest.mark.django_db
+    @pytest.mark.parametrize('cursor_pagination', [False, True])
+    def test_07_reviews_order(self, client, admin_client, admin, settings,
+                              cursor_pagination):
+        settings.REVIEWS_CURSOR_PAGINATION = cursor_pagination
+        reviews, titles, _, _ = create_reviews(admin_client, admin)
+        response = client.get(f'/api/v1/titles/{titles[0]["id"]}/reviews/')
+        assert response.status_code == 200, (
+            'Проверьте, что при GET запросе `/api/v1/titles/{title_id}/reviews/` '
+            'без токена авторизации возвращается статус 200'
+        )
+        assert [review['id'] for review in response.json()['results']] == [
+            review['id'] for review in reviews
+        ], (
+            'Проверьте, что отзывы возвращаются в порядке публикации '
+            'независимо от способа пагинации'
+        )
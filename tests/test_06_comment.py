@@ -246,3 +246,54 @@ class Test06CommentAPI:
             'без токена авторизации возвращается статус 401'
         )
         self.check_permissions(user, 'обычного пользователя', f'{pre_url}{comments[2]["id"]}/')
+
+    @pytest.mark.django_db
+    def test_05_comment_edit_by_moderator(self, admin_client, admin):
+        comments, reviews, titles, user, moderator = create_comments(admin_client, admin)
+        client_user = auth_client(user)
+        client_moderator = auth_client(moderator)
+        url = f'/api/v1/titles/{titles[0]["id"]}/reviews/{reviews[0]["id"]}/comments/'
+        response = client_user.patch(f'{url}{comments[2]["id"]}/', data={'text': 'new'})
+        assert response.status_code == 403, (
+            'Проверьте, что при PATCH запросе '
+            '`/api/v1/titles/{title_id}/reviews/{review_id}/comments/{comment_id}/` '
+            'пользователь не может изменить чужой комментарий'
+        )
+        response = client_user.delete(f'{url}{comments[0]["id"]}/')
+        assert response.status_code == 403, (
+            'Проверьте, что при DELETE запросе '
+            '`/api/v1/titles/{title_id}/reviews/{review_id}/comments/{comment_id}/` '
+            'пользователь не может удалить чужой комментарий'
+        )
+        response = client_moderator.patch(f'{url}{comments[0]["id"]}/', data={'text': 'new'})
+        assert response.status_code == 200, (
+            'Проверьте, что при PATCH запросе '
+            '`/api/v1/titles/{title_id}/reviews/{review_id}/comments/{comment_id}/` '
+            'модератор может изменить чужой комментарий'
+        )
+        response = client_moderator.delete(f'{url}{comments[1]["id"]}/')
+        assert response.status_code == 204, (
+            'Проверьте, что при DELETE запросе '
+            '`/api/v1/titles/{title_id}/reviews/{review_id}/comments/{comment_id}/` '
+            'модератор может удалить чужой комментарий'
+        )
+
+    @pytest.mark.django_db
+    def test_06_comment_missing_review(self, admin_client):
+        from reviews.models import Comment
+
+        url = '/api/v1/titles/999/reviews/999/comments/'
+        response = admin_client.post(url, data={'text': 'qwerty'})
+        assert response.status_code == 404, (
+            'Проверьте, что при POST запросе `/api/v1/titles/{title_id}/reviews/{review_id}/comments/` '
+            'с не существующим review_id возвращается статус 404'
+        )
+        assert not Comment.objects.filter(review_id=999).exists(), (
+            'Проверьте, что при POST запросе `/api/v1/titles/{title_id}/reviews/{review_id}/comments/` '
+            'с не существующим review_id комментарий не создается'
+        )
+        response = admin_client.post(url, data={})
+        assert response.status_code == 404, (
+            'Проверьте, что при POST запросе `/api/v1/titles/{title_id}/reviews/{review_id}/comments/` '
+            'с не существующим review_id и неверными данными возвращается статус 404'
+        )
@@ -0,0 +1,102 @@
+import pytest
+
+from .common import (create_comments, create_reviews, create_titles,
+                     create_users_api)
+
+
+class Test08Queries:
+
+    @pytest.mark.django_db
+    def test_01_title_list_queries(self, client, admin_client,
+                                   django_assert_num_queries):
+        create_titles(admin_client)
+        with django_assert_num_queries(3):
+            response = client.get('/api/v1/titles/')
+        assert response.status_code == 200, (
+            'Проверьте, что при GET запросе `/api/v1/titles/` без токена авторизации возвращается статус 200'
+        )
+        assert response.json()['count'] == 2, (
+            'Проверьте, что при GET запросе `/api/v1/titles/` возвращаете все произведения'
+        )
+
+    @pytest.mark.django_db
+    def test_02_review_list_queries(self, client, admin_client, admin,
+                                    django_assert_num_queries):
+        _, titles, _, _ = create_reviews(admin_client, admin)
+        with django_assert_num_queries(3):
+            response = client.get(f'/api/v1/titles/{titles[0]["id"]}/reviews/')
+        assert response.status_code == 200, (
+            'Проверьте, что при GET запросе `/api/v1/titles/{title_id}/reviews/` '
+            'без токена авторизации возвращается статус 200'
+        )
+
+    @pytest.mark.django_db
+    def test_03_comment_list_queries(self, client, admin_client, admin,
+                                     django_assert_num_queries):
+        _, reviews, titles, _, _ = create_comments(admin_client, admin)
+        with django_assert_num_queries(3):
+            response = client.get(
+                f'/api/v1/titles/{titles[0]["id"]}/reviews/{reviews[0]["id"]}/comments/'
+            )
+        assert response.status_code == 200, (
+            'Проверьте, что при GET запросе `/api/v1/titles/{title_id}/reviews/{review_id}/comments/` '
+            'без токена авторизации возвращается статус 200'
+        )
+
+    @pytest.mark.django_db
+    def test_05_review_cursor_pagination(self, client, admin_client, admin,
+                                         settings, django_assert_num_queries):
+        settings.REVIEWS_CURSOR_PAGINATION = True
+        _, titles, _, _ = create_reviews(admin_client, admin)
+        with django_assert_num_queries(2):
+            response = client.get(f'/api/v1/titles/{titles[0]["id"]}/reviews/')
+        assert response.status_code == 200, (
+            'Проверьте, что при GET запросе `/api/v1/titles/{title_id}/reviews/` '
+            'без токена авторизации возвращается статус 200'
+        )
+        data = response.json()
+        assert 'count' not in data and len(data['results']) == 3, (
+            'Проверьте, что курсорная пагинация отзывов возвращает все отзывы без `count`'
+        )
+
+    @pytest.mark.django_db
+    def test_06_users_list_cache(self, admin_client, django_assert_num_queries):
+        response = admin_client.get('/api/v1/users/')
+        assert response.status_code == 200, (
+            'Проверьте, что при GET запросе `/api/v1/users/` с токеном авторизации возвращается статус 200'
+        )
+        with django_assert_num_queries(1):
+            cached = admin_client.get('/api/v1/users/')
+        assert cached.json() == response.json(), (
+            'Проверьте, что повторный GET запрос `/api/v1/users/` возвращает те же данные из кэша'
+        )
+        create_users_api(admin_client)
+        response = admin_client.get('/api/v1/users/')
+        assert response.json()['count'] == 3, (
+            'Проверьте, что после изменения пользователей кэш списка `/api/v1/users/` сбрасывается'
+        )
+
+    @pytest.mark.django_db
+    def test_09_review_create_queries(self, admin_client, django_assert_num_queries):
+        titles, _, _ = create_titles(admin_client)
+        data = {'text': 'qwerty', 'score': 5}
+        # user and title lookups, savepoint, review insert,
+        # title rating update and savepoint release
+        with django_assert_num_queries(6):
+            response = admin_client.post(f'/api/v1/titles/{titles[0]["id"]}/reviews/', data=data)
+        assert response.status_code == 201, (
+            'Проверьте, что при POST запросе `/api/v1/titles/{title_id}/reviews/` '
+            'с правильными данными возвращает статус 201'
+        )
+
+    @pytest.mark.django_db
+    def test_15_users_list_cache_disabled(self, admin_client, settings,
+                                          django_assert_num_queries):
+        settings.USERS_LIST_CACHE_TIMEOUT = 0
+        admin_client.get('/api/v1/users/')
+        # user lookup, count and users page
+        with django_assert_num_queries(3):
+            response = admin_client.get('/api/v1/users/')
+        assert response.status_code == 200, (
+            'Проверьте, что при GET запросе `/api/v1/users/` с токеном авторизации возвращается статус 200'
+        )